@@ -10,12 +10,13 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from threading import local
 from typing import TYPE_CHECKING, Any, cast
-from weakref import WeakValueDictionary
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
 
 from ._error import Timeout
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Callable
     from types import TracebackType
 
     if sys.version_info >= (3, 11):  # pragma: no cover (py311+)
@@ -33,6 +34,8 @@ _LOGGER = logging.getLogger("filelock")
 class AcquireReturnProxy:
     """A context-aware object that will release the lock file when exiting."""
 
+    __slots__ = ("lock",)
+
     def __init__(self, lock: BaseFileLock) -> None:
         self.lock = lock
 
@@ -78,6 +81,20 @@ class ThreadLocalFileContext(FileLockContext, local):
     """A thread local version of the ``FileLockContext`` class."""
 
 
+# Signature introspection is slow, so the ``__init__`` parameter names are cached per lock class. Both the class and its
+# ``__init__`` are only weakly referenced, so dynamically created lock classes can still be garbage collected.
+_INIT_PARAMETERS: WeakKeyDictionary[type, tuple[ref[Callable[..., None]], frozenset[str]]] = WeakKeyDictionary()
+
+
+def _init_parameters(cls: type) -> frozenset[str]:
+    init = cls.__init__  # type: ignore[misc]
+    cached = _INIT_PARAMETERS.get(cls)
+    if cached is None or cached[0]() is not init:  # first use, or ``__init__`` was replaced since
+        cached = ref(init), frozenset(inspect.signature(init).parameters)
+        _INIT_PARAMETERS[cls] = cached
+    return cached[1]
+
+
 class FileLockMeta(ABCMeta):
     def __call__(  # noqa: PLR0913
         cls,
@@ -128,7 +145,7 @@ class FileLockMeta(ABCMeta):
             **kwargs,
         }
 
-        present_params = inspect.signature(cls.__init__).parameters  # type: ignore[misc]
+        present_params = _init_parameters(cls)
         init_params = {key: value for key, value in all_params.items() if key in present_params}
 
         instance = super().__call__(lock_file, **init_params)
@@ -180,13 +197,13 @@ class BaseFileLock(contextlib.ContextDecorator, metaclass=FileLockMeta):
 
         # Create the context. Note that external code should not work with the context directly and should instead use
         # properties of this class.
-        kwargs: dict[str, Any] = {
-            "lock_file": os.fspath(lock_file),
-            "timeout": timeout,
-            "mode": mode,
-            "blocking": blocking,
-        }
-        self._context: FileLockContext = (ThreadLocalFileContext if thread_local else FileLockContext)(**kwargs)
+        context_cls = ThreadLocalFileContext if thread_local else FileLockContext
+        self._context: FileLockContext = context_cls(
+            lock_file=os.fspath(lock_file),
+            timeout=timeout,
+            mode=mode,
+            blocking=blocking,
+        )
 
     def is_thread_local(self) -> bool:
         """:return: a flag indicating if this lock is thread local or not"""
@@ -281,7 +298,8 @@ class BaseFileLock(contextlib.ContextDecorator, metaclass=FileLockMeta):
 
         :param timeout: maximum wait time for acquiring the lock, ``None`` means use the default :attr:`~timeout` is and
          if ``timeout < 0``, there is no timeout and this method will block until the lock could be acquired
-        :param poll_interval: interval of trying to acquire the lock file
+        :param poll_interval: the longest interval between attempts to acquire the lock file; the first retries wait \
+         much shorter and the wait doubles after each failed attempt until it reaches this value
         :param poll_intervall: deprecated, kept for backwards compatibility, use ``poll_interval`` instead
         :param blocking: defaults to True. If False, function will return immediately if it cannot obtain a lock on the
          first attempt. Otherwise, this method will block until the timeout expires or the lock is acquired.
@@ -324,7 +342,8 @@ class BaseFileLock(contextlib.ContextDecorator, metaclass=FileLockMeta):
 
         lock_id = id(self)
         lock_filename = self.lock_file
-        start_time = time.perf_counter()
+        start_time = time.perf_counter() if timeout >= 0 else 0.0  # only read the clock when there is a deadline
+        poll_wait = poll_interval / 512  # back off exponentially from here, reaching poll_interval after 9 attempts
         try:
             while True:
                 if not self.is_locked:
@@ -340,8 +359,9 @@ class BaseFileLock(contextlib.ContextDecorator, metaclass=FileLockMeta):
                     _LOGGER.debug("Timeout on acquiring lock %s on %s", lock_id, lock_filename)
                     raise Timeout(lock_filename)  # noqa: TRY301
                 msg = "Lock %s not acquired on %s, waiting %s seconds ..."
-                _LOGGER.debug(msg, lock_id, lock_filename, poll_interval)
-                time.sleep(poll_interval)
+                _LOGGER.debug(msg, lock_id, lock_filename, poll_wait)
+                time.sleep(poll_wait)
+                poll_wait = min(poll_wait * 2, poll_interval)
         except BaseException:  # Something did go wrong, so decrement the counter.
             self._context.lock_counter = max(0, self._context.lock_counter - 1)
             raise
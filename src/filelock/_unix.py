@@ -5,7 +5,6 @@ import sys
 from contextlib import suppress
 from errno import ENOSYS
 from pathlib import Path
-from typing import cast
 
 from ._api import BaseFileLock
 from ._util import ensure_directory_exists
@@ -56,7 +55,8 @@ else:  # pragma: win32 no cover
             # Do not remove the lockfile:
             #   https://github.com/tox-dev/py-filelock/issues/31
             #   https://stackoverflow.com/questions/17708885/flock-removing-locked-file-without-race-condition
-            fd = cast("int", self._context.lock_file_fd)
+            fd = self._context.lock_file_fd
+            assert fd is not None  # noqa: S101
             self._context.lock_file_fd = None
             fcntl.flock(fd, fcntl.LOCK_UN)
             os.close(fd)
@@ -43,7 +43,9 @@ def ensure_directory_exists(filename: Path | str) -> None:
     :param filename: file.
 
     """
-    Path(filename).parent.mkdir(parents=True, exist_ok=True)
+    parent = Path(filename).parent
+    if not parent.is_dir():  # a single stat when the directory already exists, which is the common case
+        parent.mkdir(parents=True, exist_ok=True)
 
 
 __all__ = [
@@ -5,7 +5,6 @@ import sys
 from contextlib import suppress
 from errno import EACCES
 from pathlib import Path
-from typing import cast
 
 from ._api import BaseFileLock
 from ._util import ensure_directory_exists, raise_on_not_writable_file
@@ -40,7 +39,8 @@ if sys.platform == "win32":  # pragma: win32 cover
                     self._context.lock_file_fd = fd
 
         def _release(self) -> None:
-            fd = cast("int", self._context.lock_file_fd)
+            fd = self._context.lock_file_fd
+            assert fd is not None  # noqa: S101
             self._context.lock_file_fd = None
             msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
             os.close(fd)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
 import os
 import time
@@ -52,6 +51,8 @@ class AsyncThreadLocalFileContext(AsyncFileLockContext, local):
 class AsyncAcquireReturnProxy:
     """A context-aware object that will release the lock file when exiting."""
 
+    __slots__ = ("lock",)
+
     def __init__(self, lock: BaseAsyncFileLock) -> None:  # noqa: D107
         self.lock = lock
 
@@ -138,17 +139,15 @@ class BaseAsyncFileLock(BaseFileLock, metaclass=AsyncFileLockMeta):
 
         # Create the context. Note that external code should not work with the context directly and should instead use
         # properties of this class.
-        kwargs: dict[str, Any] = {
-            "lock_file": os.fspath(lock_file),
-            "timeout": timeout,
-            "mode": mode,
-            "blocking": blocking,
-            "loop": loop,
-            "run_in_executor": run_in_executor,
-            "executor": executor,
-        }
-        self._context: AsyncFileLockContext = (AsyncThreadLocalFileContext if thread_local else AsyncFileLockContext)(
-            **kwargs
+        context_cls = AsyncThreadLocalFileContext if thread_local else AsyncFileLockContext
+        self._context: AsyncFileLockContext = context_cls(
+            lock_file=os.fspath(lock_file),
+            timeout=timeout,
+            mode=mode,
+            blocking=blocking,
+            loop=loop,
+            run_in_executor=run_in_executor,
+            executor=executor,
         )
 
     @property
@@ -190,7 +189,8 @@ class BaseAsyncFileLock(BaseFileLock, metaclass=AsyncFileLockMeta):
         :param timeout: maximum wait time for acquiring the lock, ``None`` means use the default
             :attr:`~BaseFileLock.timeout` is and if ``timeout < 0``, there is no timeout and
             this method will block until the lock could be acquired
-        :param poll_interval: interval of trying to acquire the lock file
+        :param poll_interval: the longest interval between attempts to acquire the lock file; the first retries wait \
+            much shorter and the wait doubles after each failed attempt until it reaches this value
         :param blocking: defaults to True. If False, function will return immediately if it cannot obtain a lock on the
          first attempt. Otherwise, this method will block until the timeout expires or the lock is acquired.
         :raises Timeout: if fails to acquire lock within the timeout period
@@ -222,7 +222,8 @@ class BaseAsyncFileLock(BaseFileLock, metaclass=AsyncFileLockMeta):
 
         lock_id = id(self)
         lock_filename = self.lock_file
-        start_time = time.perf_counter()
+        start_time = time.perf_counter() if timeout >= 0 else 0.0  # only read the clock when there is a deadline
+        poll_wait = poll_interval / 512  # back off exponentially from here, reaching poll_interval after 9 attempts
         try:
             while True:
                 if not self.is_locked:
@@ -238,8 +239,9 @@ class BaseAsyncFileLock(BaseFileLock, metaclass=AsyncFileLockMeta):
                     _LOGGER.debug("Timeout on acquiring lock %s on %s", lock_id, lock_filename)
                     raise Timeout(lock_filename)  # noqa: TRY301
                 msg = "Lock %s not acquired on %s, waiting %s seconds ..."
-                _LOGGER.debug(msg, lock_id, lock_filename, poll_interval)
-                await asyncio.sleep(poll_interval)
+                _LOGGER.debug(msg, lock_id, lock_filename, poll_wait)
+                await asyncio.sleep(poll_wait)
+                poll_wait = min(poll_wait * 2, poll_interval)
         except BaseException:  # Something did go wrong, so decrement the counter.
             self._context.lock_counter = max(0, self._context.lock_counter - 1)
             raise
@@ -313,12 +315,14 @@ class BaseAsyncFileLock(BaseFileLock, metaclass=AsyncFileLockMeta):
 
     def __del__(self) -> None:
         """Called when the lock object is deleted."""
-        with contextlib.suppress(RuntimeError):
+        try:
             loop = self.loop or asyncio.get_running_loop()
             if not loop.is_running():  # pragma: no cover
                 loop.run_until_complete(self.release(force=True))
             else:
                 loop.create_task(self.release(force=True))
+        except RuntimeError:  # no running event loop, or the loop is already closed
+            return
 
 
 class AsyncSoftFileLock(SoftFileLock, BaseAsyncFileLock):
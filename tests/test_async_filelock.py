@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 import logging
+import re
+import threading
+from contextlib import AsyncExitStack
 from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from filelock import AsyncFileLock, AsyncSoftFileLock, BaseAsyncFileLock, Timeout
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
-@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock])
+# the tests only do microseconds of work each, so share one event loop across the module
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+TIMEOUT_RE = re.compile(r"The file lock '.*' could not be acquired\.")
+
+
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
 @pytest.mark.parametrize("path_type", [str, PurePath, Path])
 @pytest.mark.parametrize("filename", ["a", "new/b", "new2/new3/c"])
-@pytest.mark.asyncio
 async def test_simple(
     lock_type: type[BaseAsyncFileLock],
     path_type: type[str | Path],
@@ -40,10 +51,9 @@ async def test_simple(
     assert logging.getLogger("filelock").level == logging.NOTSET
 
 
-@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock])
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
 @pytest.mark.parametrize("path_type", [str, PurePath, Path])
 @pytest.mark.parametrize("filename", ["a", "new/b", "new2/new3/c"])
-@pytest.mark.asyncio
 async def test_acquire(
     lock_type: type[BaseAsyncFileLock],
     path_type: type[str | Path],
@@ -72,72 +82,115 @@ async def test_acquire(
     assert logging.getLogger("filelock").level == logging.NOTSET
 
 
-@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock])
-@pytest.mark.asyncio
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
+async def test_nested_context_manager(lock_type: type[BaseAsyncFileLock], tmp_path: Path) -> None:
+    # lock is not released before the most outer async with statement that locked the lock, is left
+    lock = lock_type(str(tmp_path / "a"))
+
+    async with AsyncExitStack() as stack:
+        levels: list[AsyncExitStack] = []
+        for depth in range(1, 4):
+            level = await stack.enter_async_context(AsyncExitStack())
+            assert await level.enter_async_context(lock) is lock
+            assert lock.is_locked
+            assert lock.lock_counter == depth
+            levels.append(level)
+
+        # leave the levels one at a time, only leaving the outermost one releases the lock
+        for depth in range(2, -1, -1):
+            await levels.pop().aclose()
+            assert lock.is_locked is (depth > 0)
+            assert lock.lock_counter == depth
+    assert not lock.is_locked
+
+
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
+async def test_nested_acquire(lock_type: type[BaseAsyncFileLock], tmp_path: Path) -> None:
+    # lock is not released before the most outer async with statement that locked the lock, is left
+    lock = lock_type(str(tmp_path / "a"))
+
+    async with AsyncExitStack() as stack:
+        levels: list[AsyncExitStack] = []
+        for depth in range(1, 4):
+            level = await stack.enter_async_context(AsyncExitStack())
+            assert await level.enter_async_context(await lock.acquire()) is lock
+            assert lock.is_locked
+            assert lock.lock_counter == depth
+            levels.append(level)
+
+        # leave the levels one at a time, only leaving the outermost one releases the lock
+        for depth in range(2, -1, -1):
+            await levels.pop().aclose()
+            assert lock.is_locked is (depth > 0)
+            assert lock.lock_counter == depth
+    assert not lock.is_locked
+
+
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
 async def test_non_blocking(lock_type: type[BaseAsyncFileLock], tmp_path: Path) -> None:
     # raises Timeout error when the lock cannot be acquired
-    lock_path = tmp_path / "a"
-    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
-    lock_3 = lock_type(str(lock_path), blocking=False)
-    lock_4 = lock_type(str(lock_path), timeout=0)
-    lock_5 = lock_type(str(lock_path), blocking=False, timeout=-1)
+    lock_path = str(tmp_path / "a")
+    # plain locks 1 and 2, then locks 3 to 5 pre-parametrized to not block
+    configs: list[dict[str, Any]] = [{}, {}, {"blocking": False}, {"timeout": 0}, {"blocking": False, "timeout": -1}]
+    lock_1, lock_2, lock_3, lock_4, lock_5 = (lock_type(lock_path, **config) for config in configs)
 
-    # acquire lock 1
+    # acquire lock 1, released in finally so a failure cannot leave it held on the shared loop
     await lock_1.acquire()
-    assert lock_1.is_locked
-    assert not lock_2.is_locked
-    assert not lock_3.is_locked
-    assert not lock_4.is_locked
-    assert not lock_5.is_locked
+    try:
+        assert lock_1.is_locked
+        assert not lock_2.is_locked
+        assert not lock_3.is_locked
+        assert not lock_4.is_locked
+        assert not lock_5.is_locked
 
-    # try to acquire lock 2
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        await lock_2.acquire(blocking=False)
-    assert not lock_2.is_locked
-    assert lock_1.is_locked
+        # try to acquire lock 2
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            await lock_2.acquire(blocking=False)
+        assert not lock_2.is_locked
+        assert lock_1.is_locked
 
-    # try to acquire pre-parametrized `blocking=False` lock 3 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        await lock_3.acquire()
-    assert not lock_3.is_locked
-    assert lock_1.is_locked
+        # try to acquire pre-parametrized `blocking=False` lock 3 with `acquire`
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            await lock_3.acquire()
+        assert not lock_3.is_locked
+        assert lock_1.is_locked
 
-    # try to acquire pre-parametrized `blocking=False` lock 3 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        async with lock_3:
-            pass
-    assert not lock_3.is_locked
-    assert lock_1.is_locked
+        # try to acquire pre-parametrized `blocking=False` lock 3 with context manager
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            async with lock_3:
+                pass
+        assert not lock_3.is_locked
+        assert lock_1.is_locked
 
-    # try to acquire pre-parametrized `timeout=0` lock 4 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        await lock_4.acquire()
-    assert not lock_4.is_locked
-    assert lock_1.is_locked
+        # try to acquire pre-parametrized `timeout=0` lock 4 with `acquire`
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            await lock_4.acquire()
+        assert not lock_4.is_locked
+        assert lock_1.is_locked
 
-    # try to acquire pre-parametrized `timeout=0` lock 4 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        async with lock_4:
-            pass
-    assert not lock_4.is_locked
-    assert lock_1.is_locked
-
-    # blocking precedence over timeout
-    # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        await lock_5.acquire()
-    assert not lock_5.is_locked
-    assert lock_1.is_locked
+        # try to acquire pre-parametrized `timeout=0` lock 4 with context manager
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            async with lock_4:
+                pass
+        assert not lock_4.is_locked
+        assert lock_1.is_locked
 
-    # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        async with lock_5:
-            pass
-    assert not lock_5.is_locked
-    assert lock_1.is_locked
+        # blocking precedence over timeout
+        # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with `acquire`
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            await lock_5.acquire()
+        assert not lock_5.is_locked
+        assert lock_1.is_locked
 
-    # release lock 1
-    await lock_1.release()
+        # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with context manager
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            async with lock_5:
+                pass
+        assert not lock_5.is_locked
+        assert lock_1.is_locked
+    finally:
+        # release lock 1
+        await lock_1.release()
     assert not lock_1.is_locked
     assert not lock_2.is_locked
     assert not lock_3.is_locked
@@ -145,9 +198,8 @@ async def test_non_blocking(lock_type: type[BaseAsyncFileLock], tmp_path: Path)
     assert not lock_5.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock])
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
 @pytest.mark.parametrize("thread_local", [True, False])
-@pytest.mark.asyncio
 async def test_non_executor(lock_type: type[BaseAsyncFileLock], thread_local: bool, tmp_path: Path) -> None:
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path), thread_local=thread_local, run_in_executor=False)
@@ -157,19 +209,21 @@ async def test_non_executor(lock_type: type[BaseAsyncFileLock], thread_local: bo
     assert not lock.is_locked
 
 
-@pytest.mark.asyncio
 async def test_coroutine_function(tmp_path: Path) -> None:
     acquired = released = False
+    threads: set[int] = set()
 
     class AioFileLock(BaseAsyncFileLock):
         async def _acquire(self) -> None:  # type: ignore[override]
             nonlocal acquired
             acquired = True
+            threads.add(threading.get_ident())
             self._context.lock_file_fd = 1
 
         async def _release(self) -> None:  # type: ignore[override]
             nonlocal released
             released = True
+            threads.add(threading.get_ident())
             self._context.lock_file_fd = None
 
     lock = AioFileLock(str(tmp_path / "a"))
@@ -179,3 +233,24 @@ async def test_coroutine_function(tmp_path: Path) -> None:
     await lock.release()
     assert acquired
     assert released
+    assert threads == {threading.get_ident()}  # coroutine methods are awaited on the loop, never in an executor
+
+
+@pytest.mark.parametrize("lock_type", [AsyncFileLock, AsyncSoftFileLock], ids=["async-hard", "async-soft"])
+async def test_poll_interval_backoff(lock_type: type[BaseAsyncFileLock], tmp_path: Path, mocker: MockerFixture) -> None:
+    lock_path = tmp_path / "a"
+    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
+    waits: list[float] = []
+
+    async def sleep(seconds: float) -> None:  # record the wait instead of sleeping, and give way after a dozen retries
+        waits.append(seconds)
+        if len(waits) == 12:
+            await lock_1.release()
+
+    mocker.patch("filelock.asyncio.asyncio.sleep", new=sleep)
+    await lock_1.acquire()
+    async with await lock_2.acquire(poll_interval=0.01):
+        assert lock_2.is_locked
+
+    # the first retry comes much sooner than the poll interval, then the wait doubles until it is capped there
+    assert waits == pytest.approx([0.01 / 2 ** (9 - attempt) for attempt in range(9)] + [0.01] * 3)
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import pickle  # noqa: S403
 
+import pytest
+
 from filelock import Timeout
 
 
+@pytest.fixture(scope="module", params=range(pickle.HIGHEST_PROTOCOL + 1))
+def pickled_timeout(request: pytest.FixtureRequest) -> bytes:
+    # serialized once per protocol, the tests only pay for loading it back
+    return pickle.dumps(Timeout("/path/to/lock"), protocol=request.param)
+
+
 def test_timeout_str() -> None:
     timeout = Timeout("/path/to/lock")
     assert str(timeout) == "The file lock '/path/to/lock' could not be acquired."
@@ -20,9 +28,9 @@ def test_timeout_lock_file() -> None:
     assert timeout.lock_file == "/path/to/lock"
 
 
-def test_timeout_pickle() -> None:
+def test_timeout_pickle(pickled_timeout: bytes) -> None:
     timeout = Timeout("/path/to/lock")
-    timeout_loaded = pickle.loads(pickle.dumps(timeout))  # noqa: S301
+    timeout_loaded = pickle.loads(pickled_timeout)  # noqa: S301
 
     assert timeout.__class__ == timeout_loaded.__class__
     assert str(timeout) == str(timeout_loaded)
@@ -1,30 +1,40 @@
 from __future__ import annotations
 
+import gc
 import inspect
 import logging
+import multiprocessing
 import os
+import re
 import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from errno import ENOSYS
-from inspect import getframeinfo, stack
 from pathlib import Path, PurePath
 from stat import S_IWGRP, S_IWOTH, S_IWUSR, filemode
-from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Iterator
 from uuid import uuid4
-from weakref import WeakValueDictionary
+from weakref import WeakValueDictionary, ref
 
 import pytest
 
 from filelock import BaseFileLock, FileLock, SoftFileLock, Timeout, UnixFileLock, WindowsFileLock
 
 if TYPE_CHECKING:
+    from multiprocessing.synchronize import Barrier as BarrierType
+
     from pytest_mock import MockerFixture
 
+TIMEOUT_RE = re.compile(r"The file lock '.*' could not be acquired\.")
+
+# enough threads and iterations to contend on the lock, without turning the threaded tests into a benchmark
+NUM_THREADS = 32
+ITERS = 32
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 @pytest.mark.parametrize("path_type", [str, PurePath, Path])
 @pytest.mark.parametrize("filename", ["a", "new/b", "new2/new3/c"])
 def test_simple(
@@ -63,13 +73,15 @@ def make_ro(path: Path) -> Iterator[None]:
     path.chmod(path.stat().st_mode | write)
 
 
-@pytest.fixture
-def tmp_path_ro(tmp_path: Path) -> Iterator[Path]:
-    with make_ro(tmp_path):
-        yield tmp_path
+@pytest.fixture(scope="module")
+def tmp_path_ro(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    # tests only try (and fail) to acquire a lock in here, so one read-only folder serves the whole module
+    path = tmp_path_factory.mktemp("ro")
+    with make_ro(path):
+        yield path
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 @pytest.mark.skipif(sys.platform == "win32", reason="Windows does not have read only folders")
 @pytest.mark.skipif(
     sys.platform != "win32" and os.geteuid() == 0,
@@ -81,15 +93,15 @@ def test_ro_folder(lock_type: type[BaseFileLock], tmp_path_ro: Path) -> None:
         lock.acquire()
 
 
-@pytest.fixture
-def tmp_file_ro(tmp_path: Path) -> Iterator[Path]:
-    filename = tmp_path / "a"
+@pytest.fixture(scope="module")
+def tmp_file_ro(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    filename = tmp_path_factory.mktemp("ro_file") / "a"
     filename.write_text("")
     with make_ro(filename):
         yield filename
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 @pytest.mark.skipif(
     sys.platform != "win32" and os.geteuid() == 0,
     reason="Cannot make a read only file (that the current user: root can't read)",
@@ -103,7 +115,7 @@ def test_ro_file(lock_type: type[BaseFileLock], tmp_file_ro: Path) -> None:
 WindowsOnly = pytest.mark.skipif(sys.platform != "win32", reason="Windows only")
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 @pytest.mark.parametrize(
     ("expected_error", "match", "bad_lock_file"),
     [
@@ -138,53 +150,53 @@ def test_bad_lock_file(
         lock.acquire()
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_nested_context_manager(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is not released before the most outer with statement that locked the lock, is left
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
-    with lock as lock_1:
-        assert lock.is_locked
-        assert lock is lock_1
-
-        with lock as lock_2:
+    with ExitStack() as stack:
+        levels: list[ExitStack] = []
+        for depth in range(1, 4):
+            level = stack.enter_context(ExitStack())
+            assert level.enter_context(lock) is lock
             assert lock.is_locked
-            assert lock is lock_2
-
-            with lock as lock_3:
-                assert lock.is_locked
-                assert lock is lock_3
-
-            assert lock.is_locked
-        assert lock.is_locked
+            assert lock.lock_counter == depth
+            levels.append(level)
+
+        # leave the levels one at a time, only leaving the outermost one releases the lock
+        for depth in range(2, -1, -1):
+            levels.pop().close()
+            assert lock.is_locked is (depth > 0)
+            assert lock.lock_counter == depth
     assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_nested_acquire(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is not released before the most outer with statement that locked the lock, is left
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
-    with lock.acquire() as lock_1:
-        assert lock.is_locked
-        assert lock is lock_1
-
-        with lock.acquire() as lock_2:
+    with ExitStack() as stack:
+        levels: list[ExitStack] = []
+        for depth in range(1, 4):
+            level = stack.enter_context(ExitStack())
+            assert level.enter_context(lock.acquire()) is lock
             assert lock.is_locked
-            assert lock is lock_2
-
-            with lock.acquire() as lock_3:
-                assert lock.is_locked
-                assert lock is lock_3
-
-            assert lock.is_locked
-        assert lock.is_locked
+            assert lock.lock_counter == depth
+            levels.append(level)
+
+        # leave the levels one at a time, only leaving the outermost one releases the lock
+        for depth in range(2, -1, -1):
+            levels.pop().close()
+            assert lock.is_locked is (depth > 0)
+            assert lock.lock_counter == depth
     assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_nested_forced_release(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # acquires the lock using a with-statement and releases the lock before leaving the with-statement
     lock_path = tmp_path / "a"
@@ -201,7 +213,7 @@ def test_nested_forced_release(lock_type: type[BaseFileLock], tmp_path: Path) ->
     assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_nested_contruct(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is re-entrant for a given file even if it is constructed multiple times
     lock_path = tmp_path / "a"
@@ -218,81 +230,74 @@ def test_nested_contruct(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_1.is_locked
 
 
-_ExcInfoType = Union[Tuple[Type[BaseException], BaseException, TracebackType], Tuple[None, None, None]]
-
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_threaded_shared_lock_obj(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # Runs NUM_THREADS threads, which need the filelock. The lock must be acquired if at least one thread required it
+    # and released, as soon as all threads stopped.
+    lock_path = tmp_path / "a"
+    lock = lock_type(str(lock_path))
 
-class ExThread(threading.Thread):
-    def __init__(self, target: Callable[[], None], name: str) -> None:
-        super().__init__(target=target, name=name)
-        self.ex: _ExcInfoType | None = None
+    def thread_work() -> None:
+        with lock:  # each thread takes the file lock once, the nested acquires below only bump the lock counter
+            for _ in range(ITERS):
+                with lock:
+                    assert lock.is_locked
 
-    def run(self) -> None:
-        try:
-            super().run()
-        except Exception:  # noqa: BLE001 # pragma: no cover
-            self.ex = sys.exc_info()  # pragma: no cover
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = [executor.submit(thread_work) for _ in range(NUM_THREADS)]
 
-    def join(self, timeout: float | None = None) -> None:
-        super().join(timeout=timeout)
-        if self.ex is not None:
-            raise RuntimeError from self.ex[1]  # pragma: no cover
+    assert all(r.result() is None for r in results)
+    assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
-def test_threaded_shared_lock_obj(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
-    # Runs 100 threads, which need the filelock. The lock must be acquired if at least one thread required it and
-    # released, as soon as all threads stopped.
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_threaded_shared_lock_obj_churn(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # Fewer threads than above, but each one takes and drops the file lock on every iteration, so that the contended
+    # acquire and release of the lock file itself stays covered.
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
     def thread_work() -> None:
-        for _ in range(100):
+        for _ in range(ITERS):
             with lock:
                 assert lock.is_locked
 
-    threads = [ExThread(target=thread_work, name=f"t{i}") for i in range(100)]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    with ThreadPoolExecutor(max_workers=NUM_THREADS // 4) as executor:
+        results = [executor.submit(thread_work) for _ in range(NUM_THREADS // 4)]
 
+    assert all(r.result() is None for r in results)
     assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 @pytest.mark.skipif(hasattr(sys, "pypy_version_info") and sys.platform == "win32", reason="deadlocks randomly")
 def test_threaded_lock_different_lock_obj(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # Runs multiple threads, which acquire the same lock file with a different FileLock object. When thread group 1
     # acquired the lock, thread group 2 must not hold their lock.
 
     def t_1() -> None:
-        for _ in range(1000):
+        for _ in range(ITERS):
             with lock_1:
                 assert lock_1.is_locked
                 assert not lock_2.is_locked
 
     def t_2() -> None:
-        for _ in range(1000):
+        for _ in range(ITERS):
             with lock_2:
                 assert not lock_1.is_locked
                 assert lock_2.is_locked
 
     lock_path = tmp_path / "a"
     lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
-    threads = [(ExThread(t_1, f"t1_{i}"), ExThread(t_2, f"t2_{i}")) for i in range(10)]
-
-    for thread_1, thread_2 in threads:
-        thread_1.start()
-        thread_2.start()
-    for thread_1, thread_2 in threads:
-        thread_1.join()
-        thread_2.join()
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = [executor.submit(work) for _ in range(NUM_THREADS // 2) for work in (t_1, t_2)]
 
+    assert all(r.result() is None for r in results)
     assert not lock_1.is_locked
     assert not lock_2.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # raises Timeout error when the lock cannot be acquired
     lock_path = tmp_path / "a"
@@ -304,8 +309,8 @@ def test_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_2.is_locked
 
     # try to acquire lock 2
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        lock_2.acquire(timeout=0.1)
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
+        lock_2.acquire(timeout=0)
     assert not lock_2.is_locked
     assert lock_1.is_locked
 
@@ -315,14 +320,66 @@ def test_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_2.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
-def test_non_blocking(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
-    # raises Timeout error when the lock cannot be acquired
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_nonzero_timeout_sleeps(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # a positive timeout keeps polling until it runs out instead of giving up after the first attempt
     lock_path = tmp_path / "a"
     lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
-    lock_3 = lock_type(str(lock_path), blocking=False)
-    lock_4 = lock_type(str(lock_path), timeout=0)
-    lock_5 = lock_type(str(lock_path), blocking=False, timeout=-1)
+
+    with lock_1:
+        start = time.perf_counter()
+        with pytest.raises(Timeout, match=TIMEOUT_RE):
+            lock_2.acquire(timeout=0.05)
+        assert time.perf_counter() - start >= 0.05
+    assert not lock_2.is_locked
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_acquire_wakes_up_promptly_after_release(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # a waiting acquire picks up the lock soon after the holder releases it, long before its own timeout expires
+    lock_path = tmp_path / "a"
+    lock_1, lock_2 = lock_type(str(lock_path), thread_local=False), lock_type(str(lock_path))
+
+    lock_1.acquire()
+    timer = threading.Timer(0.05, lock_1.release)
+    timer.start()
+    start = time.perf_counter()
+    try:
+        with lock_2.acquire(timeout=5):
+            assert lock_2.is_locked
+            assert not lock_1.is_locked
+    finally:
+        timer.join()
+    assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_poll_interval_backoff(lock_type: type[BaseFileLock], tmp_path: Path, mocker: MockerFixture) -> None:
+    lock_path = tmp_path / "a"
+    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
+    waits: list[float] = []
+
+    def sleep(seconds: float) -> None:  # record the wait instead of sleeping, and give way after a dozen retries
+        waits.append(seconds)
+        if len(waits) == 12:
+            lock_1.release()
+
+    mocker.patch("filelock._api.time.sleep", side_effect=sleep)
+    lock_1.acquire()
+    with lock_2.acquire(poll_interval=0.01):
+        assert lock_2.is_locked
+
+    # the first retry comes much sooner than the poll interval, then the wait doubles until it is capped there
+    assert waits == pytest.approx([0.01 / 2 ** (9 - attempt) for attempt in range(9)] + [0.01] * 3)
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_non_blocking(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # raises Timeout error when the lock cannot be acquired
+    lock_path = str(tmp_path / "a")
+    # plain locks 1 and 2, then locks 3 to 5 pre-parametrized to not block
+    configs: list[dict[str, Any]] = [{}, {}, {"blocking": False}, {"timeout": 0}, {"blocking": False, "timeout": -1}]
+    lock_1, lock_2, lock_3, lock_4, lock_5 = (lock_type(lock_path, **config) for config in configs)
 
     # acquire lock 1
     lock_1.acquire()
@@ -333,44 +390,44 @@ def test_non_blocking(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_5.is_locked
 
     # try to acquire lock 2
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_2.acquire(blocking=False)
     assert not lock_2.is_locked
     assert lock_1.is_locked
 
     # try to acquire pre-parametrized `blocking=False` lock 3 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_3.acquire()
     assert not lock_3.is_locked
     assert lock_1.is_locked
 
     # try to acquire pre-parametrized `blocking=False` lock 3 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."), lock_3:
+    with pytest.raises(Timeout, match=TIMEOUT_RE), lock_3:
         pass
     assert not lock_3.is_locked
     assert lock_1.is_locked
 
     # try to acquire pre-parametrized `timeout=0` lock 4 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_4.acquire()
     assert not lock_4.is_locked
     assert lock_1.is_locked
 
     # try to acquire pre-parametrized `timeout=0` lock 4 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."), lock_4:
+    with pytest.raises(Timeout, match=TIMEOUT_RE), lock_4:
         pass
     assert not lock_4.is_locked
     assert lock_1.is_locked
 
     # blocking precedence over timeout
     # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with `acquire`
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_5.acquire()
     assert not lock_5.is_locked
     assert lock_1.is_locked
 
     # try to acquire pre-parametrized `timeout=-1,blocking=False` lock 5 with context manager
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."), lock_5:
+    with pytest.raises(Timeout, match=TIMEOUT_RE), lock_5:
         pass
     assert not lock_5.is_locked
     assert lock_1.is_locked
@@ -384,12 +441,12 @@ def test_non_blocking(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_5.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_default_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # test if the default timeout parameter works
     lock_path = tmp_path / "a"
-    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path), timeout=0.1)
-    assert lock_2.timeout == 0.1
+    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path), timeout=0)
+    assert lock_2.timeout == 0
 
     # acquire lock 1
     lock_1.acquire()
@@ -397,15 +454,15 @@ def test_default_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_2.is_locked
 
     # try to acquire lock 2
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_2.acquire()
     assert not lock_2.is_locked
     assert lock_1.is_locked
 
-    lock_2.timeout = 0
-    assert lock_2.timeout == 0
+    lock_2.timeout = 0.01
+    assert lock_2.timeout == 0.01
 
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
         lock_2.acquire()
     assert not lock_2.is_locked
     assert lock_1.is_locked
@@ -416,38 +473,36 @@ def test_default_timeout(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_2.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_context_release_on_exc(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is released when an exception is thrown in a with-statement
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
-    try:
-        with lock as lock_1:
-            assert lock is lock_1
-            assert lock.is_locked
-            raise ValueError  # noqa: TRY301
-    except ValueError:
-        assert not lock.is_locked
+    with pytest.raises(ValueError, match="inside the lock"), lock as lock_1:  # noqa: PT012
+        assert lock is lock_1
+        assert lock.is_locked
+        msg = "inside the lock"
+        raise ValueError(msg)
+    assert not lock.is_locked
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_acquire_release_on_exc(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is released when an exception is thrown in a acquire statement
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
-    try:
-        with lock.acquire() as lock_1:
-            assert lock is lock_1
-            assert lock.is_locked
-            raise ValueError  # noqa: TRY301
-    except ValueError:
-        assert not lock.is_locked
+    with pytest.raises(ValueError, match="inside the lock"), lock.acquire() as lock_1:  # noqa: PT012
+        assert lock is lock_1
+        assert lock.is_locked
+        msg = "inside the lock"
+        raise ValueError(msg)
+    assert not lock.is_locked
 
 
 @pytest.mark.skipif(hasattr(sys, "pypy_version_info"), reason="del() does not trigger GC in PyPy")
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_del(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is released when the object is deleted
     lock_path = tmp_path / "a"
@@ -459,13 +514,13 @@ def test_del(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     assert not lock_2.is_locked
 
     # try to acquire lock 2
-    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
-        lock_2.acquire(timeout=0.1)
+    with pytest.raises(Timeout, match=TIMEOUT_RE):
+        lock_2.acquire(blocking=False)
 
-    # delete lock 1 and try to acquire lock 2 again
+    # delete lock 1 and try to acquire lock 2 again, deleting the last reference releases the lock right away
     del lock_1
 
-    lock_2.acquire()
+    lock_2.acquire(blocking=False)
     assert lock_2.is_locked
 
     lock_2.release()
@@ -480,22 +535,22 @@ def test_cleanup_soft_lock(tmp_path: Path) -> None:
     assert not lock_path.exists()
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_poll_intervall_deprecated(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
 
     with pytest.deprecated_call(match="use poll_interval instead of poll_intervall") as checker:
         lock.acquire(poll_intervall=0.05)  # the deprecation warning will be captured by the checker
-        frame_info = getframeinfo(stack()[0][0])  # get frame info of current file and lineno (+1 than the above lineno)
+        caller_line = inspect.currentframe().f_lineno  # type: ignore[union-attr] # lineno is +1 than the above
         for warning in checker:
-            if warning.filename == frame_info.filename and warning.lineno + 1 == frame_info.lineno:  # pragma: no cover
+            if warning.filename == __file__ and warning.lineno + 1 == caller_line:  # pragma: no cover
                 break
         else:  # pragma: no cover
             pytest.fail("No warnings of stacklevel=2 matching.")
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_context_decorator(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     lock_path = tmp_path / "a"
     lock = lock_type(str(lock_path))
@@ -550,26 +605,10 @@ def test_lock_mode_soft(tmp_path: Path) -> None:
     lock.release()
 
 
-def test_umask(tmp_path: Path) -> None:
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_umask(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     lock_path = tmp_path / "a.lock"
-    lock = FileLock(str(lock_path), mode=0o666)
-
-    initial_umask = os.umask(0)
-    os.umask(initial_umask)
-
-    lock.acquire()
-    assert lock.is_locked
-
-    current_umask = os.umask(0)
-    os.umask(current_umask)
-    assert initial_umask == current_umask
-
-    lock.release()
-
-
-def test_umask_soft(tmp_path: Path) -> None:
-    lock_path = tmp_path / "a.lock"
-    lock = SoftFileLock(str(lock_path), mode=0o666)
+    lock = lock_type(str(lock_path), mode=0o666)
 
     initial_umask = os.umask(0)
     os.umask(initial_umask)
@@ -618,7 +657,7 @@ def _check_file_read_write(txt_file: Path) -> None:
         assert txt_file.read_text() == uuid
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_thrashing_with_thread_pool_passing_lock_to_threads(tmp_path: Path, lock_type: type[BaseFileLock]) -> None:
     def mess_with_file(lock_: BaseFileLock) -> None:
         with lock_:
@@ -631,7 +670,7 @@ def test_thrashing_with_thread_pool_passing_lock_to_threads(tmp_path: Path, lock
     assert all(r.result() is None for r in results)
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_thrashing_with_thread_pool_global_lock(tmp_path: Path, lock_type: type[BaseFileLock]) -> None:
     def mess_with_file() -> None:
         with lock:
@@ -645,7 +684,7 @@ def test_thrashing_with_thread_pool_global_lock(tmp_path: Path, lock_type: type[
     assert all(r.result() is None for r in results)
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_thrashing_with_thread_pool_lock_recreated_in_each_thread(
     tmp_path: Path,
     lock_type: type[BaseFileLock],
@@ -661,7 +700,49 @@ def test_thrashing_with_thread_pool_lock_recreated_in_each_thread(
     assert all(r.result() is None for r in results)
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+def _increment_counter(
+    lock_type: type[BaseFileLock],
+    lock_file: str,
+    counter_file: str,
+    start: BarrierType,
+    iterations: int,
+) -> None:
+    start.wait(timeout=30)  # line the workers up so that they really contend on the lock
+    for _ in range(iterations):
+        with lock_type(lock_file):
+            counter = Path(counter_file)
+            value = int(counter.read_text(encoding="utf-8"))
+            counter.write_text(str(value + 1), encoding="utf-8")
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_multiprocess_contention(tmp_path: Path, lock_type: type[BaseFileLock]) -> None:
+    # threads take turns at the GIL, separate processes only have the lock file to keep them apart
+    lock_file, counter_file = tmp_path / "counter.lock", tmp_path / "counter"
+    counter_file.write_text("0", encoding="utf-8")
+    workers, iterations = 2, 50
+
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Barrier(workers)
+    args = (lock_type, str(lock_file), str(counter_file), start, iterations)
+    processes = [ctx.Process(target=_increment_counter, args=args) for _ in range(workers)]
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+    finally:  # never leave a hung worker running past the test
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    assert [process.exitcode for process in processes] == [0] * workers
+    # no increment got lost to a concurrent writer
+    assert int(counter_file.read_text(encoding="utf-8")) == workers * iterations
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_lock_can_be_non_thread_local(
     tmp_path: Path,
     lock_type: type[BaseFileLock],
@@ -711,7 +792,7 @@ def test_subclass_compatibility(tmp_path: Path) -> None:
     MySoftFileLock(str(lock_path), my_param=1)
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_singleton_and_non_singleton_locks_are_distinct(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     lock_path = tmp_path / "a"
     lock_1 = lock_type(str(lock_path), is_singleton=False)
@@ -722,26 +803,20 @@ def test_singleton_and_non_singleton_locks_are_distinct(lock_type: type[BaseFile
     assert lock_2 is not lock_1
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
-def test_singleton_locks_are_the_same(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
-    lock_path = tmp_path / "a"
-    lock_1 = lock_type(str(lock_path), is_singleton=True)
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
+def test_singleton_locks_are_shared_per_lock_file(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    lock_1 = lock_type(str(tmp_path / "a"), is_singleton=True)
 
-    lock_2 = lock_type(str(lock_path), is_singleton=True)
+    # the same lock file gives back the same instance
+    lock_2 = lock_type(str(tmp_path / "a"), is_singleton=True)
     assert lock_2 is lock_1
 
-
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
-def test_singleton_locks_are_distinct_per_lock_file(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
-    lock_path_1 = tmp_path / "a"
-    lock_1 = lock_type(str(lock_path_1), is_singleton=True)
-
-    lock_path_2 = tmp_path / "b"
-    lock_2 = lock_type(str(lock_path_2), is_singleton=True)
-    assert lock_1 is not lock_2
+    # a different lock file gets its own instance
+    lock_3 = lock_type(str(tmp_path / "b"), is_singleton=True)
+    assert lock_3 is not lock_1
 
 
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_singleton_locks_must_be_initialized_with_the_same_args(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     lock_path = tmp_path / "a"
     args: dict[str, Any] = {"timeout": -1, "mode": 0o644, "thread_local": True, "blocking": True}
@@ -760,7 +835,7 @@ def test_singleton_locks_must_be_initialized_with_the_same_args(lock_type: type[
 
 
 @pytest.mark.skipif(hasattr(sys, "pypy_version_info"), reason="del() does not trigger GC in PyPy")
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_singleton_locks_are_deleted_when_no_external_references_exist(
     lock_type: type[BaseFileLock],
     tmp_path: Path,
@@ -774,7 +849,7 @@ def test_singleton_locks_are_deleted_when_no_external_references_exist(
 
 
 @pytest.mark.skipif(hasattr(sys, "pypy_version_info"), reason="del() does not trigger GC in PyPy")
-@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock], ids=["hard", "soft"])
 def test_singleton_instance_tracking_is_unique_per_subclass(lock_type: type[BaseFileLock]) -> None:
     class Lock1(lock_type):  # type: ignore[valid-type, misc]
         pass
@@ -787,6 +862,19 @@ def test_singleton_instance_tracking_is_unique_per_subclass(lock_type: type[Base
     assert Lock1._instances is not Lock2._instances  # noqa: SLF001
 
 
+def test_lock_subclass_can_be_garbage_collected(tmp_path: Path) -> None:
+    class MyFileLock(FileLock):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            super().__init__(*args, **kwargs)  # the zero-argument super() ties this __init__ to the class
+
+    lock = MyFileLock(str(tmp_path / "a"))
+    lock_class = ref(MyFileLock)
+    del lock, MyFileLock
+    gc.collect()
+
+    assert lock_class() is None  # nothing in the library keeps a dynamically created lock class alive
+
+
 def test_singleton_locks_when_inheriting_init_is_called_once(tmp_path: Path) -> None:
     init_calls = 0
 